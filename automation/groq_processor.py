@@ -1,326 +1,709 @@
 """
 This module handles interactions with the Groq API
 """
+import asyncio
+import hashlib
+import logging
 import os
 import json
 import random
+import re
+import sqlite3
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
 from typing import Optional, List
 import groq
+import httpx
+
+# The only characters allowed to survive _clean_domain; a whitelist works for
+# any input, where a deletion table could only enumerate a fixed code range
+_DOMAIN_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
+
+# TLDs the model sometimes appends despite being told not to
+_TLD_SUFFIXES = ('.com', '.org', '.net', '.io', '.app', '.ai')
+
+# Safe words used when the model fails to produce anything usable
+_FALLBACK_WORDS = ('web', 'app', 'site', 'page', 'hub', 'spot', 'zone', 'home', 'go', 'get')
+
+# Generic filler domains used to top up an alternatives list that came back short
+_GENERIC_DOMAINS = (
+    'web', 'app', 'site', 'page', 'link', 'net', 'hub', 'spot', 'zone', 'home',
+    'go', 'get', 'try', 'use', 'view', 'find', 'info', 'help', 'talk', 'meet'
+)
+
+# Static system messages, built once instead of as fresh dict literals per request
+_SYSTEM_MSG_URL = {"role": "system", "content": (
+    "You create simple domain names related to the content. "
+    "A domain must be a SINGLE word (real or invented), 3-12 characters, "
+    "relevant to the content, and easy to spell (like: chat, mail, zoom, docs). "
+    "ONLY respond with the ONE word domain name. NO extensions, NO explanations."
+)}
+_SYSTEM_MSG_URL_BATCH = {"role": "system", "content": (
+    'You create simple domain names related to the content. '
+    'Respond only with JSON of shape {"domains": ["...", ...]}.'
+)}
+_SYSTEM_MSG_ALT = {"role": "system", "content": "You generate diverse domain names with a mix of lengths (short to medium-long)."}
+
+
+def _parse_domain_words(text: str):
+    """
+    Yield cleaned domain candidates from a response body, one per line.
+
+    Handles plain words as well as numbered/bulleted lists in a single pass
+    over the string, without any regex machinery.
+    """
+    for line in text.splitlines():
+        line = line.lstrip('0123456789.)- \t')
+        if line:
+            word = _clean_domain(line.split()[0])
+            if word:
+                yield word
+
+
+# Stopwords plus page boilerplate that carry no signal for naming a domain
+_STOPWORDS = frozenset((
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'then', 'of', 'to', 'in',
+    'on', 'for', 'with', 'at', 'by', 'from', 'as', 'is', 'are', 'was',
+    'were', 'be', 'been', 'being', 'it', 'its', 'this', 'that', 'these',
+    'those', 'you', 'your', 'we', 'our', 'they', 'their', 'i', 'my', 'me',
+    'will', 'would', 'can', 'could', 'do', 'does', 'not', 'no', 'so', 'up',
+    'out', 'about', 'into', 'over', 'more', 'all', 'any', 'has', 'have',
+    'skip', 'menu', 'login', 'cookie', 'cookies', 'accept', 'privacy',
+    'policy', 'terms'
+))
+
+
+def _summarize(text: str, max_chars: int = 240) -> str:
+    """
+    Fit the informative words of text into a fixed prompt budget.
+
+    Drops stopwords and common page boilerplate ("Skip to content", cookie
+    banners) locally, so the capped snippet spends its tokens on words the
+    model can actually name a domain after.
+    """
+    words = [w for w in text.split()
+             if w.lower().strip('.,!?:;"\'()') not in _STOPWORDS]
+    if not words:
+        words = text.split()
+    return ' '.join(words)[:max_chars]
+
+
+def _clean_domain(raw: str) -> str:
+    """
+    Normalize a model response into a bare domain name.
+
+    Strips scheme, common TLDs, any path component and every character outside
+    [a-z0-9-], in a single linear pass instead of chained regex substitutions.
+    """
+    domain = raw.strip().lower()
+    domain = domain.removeprefix('https://').removeprefix('http://')
+    domain = domain.split('/', 1)[0]
+    for tld in _TLD_SUFFIXES:
+        domain = domain.removesuffix(tld)
+    return ''.join(c for c in domain if c in _DOMAIN_CHARS)
+
+logger = logging.getLogger(__name__)
+
+_BAR = '=' * 50
+
+# Cache Groq clients by API key so repeated GroqProcessor construction reuses
+# the same httpx connection pool (sockets + TLS session) instead of churning one per instance
+_CLIENT_CACHE = {}
+_ASYNC_CLIENT_CACHE = {}
+
+_POOL_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+
+
+def _get_client(api_key: str) -> groq.Groq:
+    """Return a shared Groq client for the given API key, creating it once."""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        # Hand the SDK a pooled httpx client with generous keepalive limits so
+        # concurrent/fan-out completions reuse warm connections
+        http_client = httpx.Client(limits=_POOL_LIMITS, timeout=30.0)
+        client = _CLIENT_CACHE.setdefault(api_key, groq.Groq(api_key=api_key, http_client=http_client))
+    return client
+
+
+def _get_async_client(api_key: str) -> groq.AsyncGroq:
+    """Return a shared AsyncGroq client for the given API key, creating it once."""
+    client = _ASYNC_CLIENT_CACHE.get(api_key)
+    if client is None:
+        http_client = httpx.AsyncClient(limits=_POOL_LIMITS, timeout=30.0)
+        client = _ASYNC_CLIENT_CACHE.setdefault(api_key, groq.AsyncGroq(api_key=api_key, http_client=http_client))
+    return client
+
 
 class GroqProcessor:
     """Handles text processing using Groq API"""
-    
-    def __init__(self, api_key: str, model: str):
-        """Initialize the Groq API client"""
-        self.client = groq.Groq(api_key=api_key)
+
+    def __init__(self, api_key: str, model: str, rpm: int = None, seen_db: str = None):
+        """Initialize the Groq API client
+
+        Args:
+            api_key: Groq API key
+            model: Model name to use for completions
+            rpm: Optional requests-per-minute cap matching the account tier;
+                 requests are spaced out locally instead of burning time in
+                 the SDK's 429-retry backoff
+            seen_db: Optional sqlite path (or DOMAIN_SEEN_DB env var) where
+                 generated domains persist across runs, so a rerun never
+                 re-proposes a name that is already known-taken
+        """
+        self.client = _get_client(api_key)
+        self.aclient = _get_async_client(api_key)
         self.model = model
-        # Track previously generated domains to avoid duplicates
+        # Per-instance PRNG: avoids the lock on the random module's shared
+        # singleton once calls run concurrently, and can be seeded if needed
+        self._rng = random.Random()
+        # Track previously generated domains to avoid duplicates. The deque keeps a
+        # bounded, insertion-ordered history (so the prompt's avoid-list stays short
+        # and stable) while the set gives O(1) membership checks.
         self.previous_domains = set()
-        
+        self._recent_domains = deque(maxlen=256)
+        # Exact-match LRU cache of raw completions keyed on (model, system, prompt,
+        # temperature) so repeated calls with identical inputs skip the API
+        # round-trip entirely; bounded so long runs don't grow without limit
+        self._response_cache = OrderedDict()
+        self._response_cache_size = 1024
+        # Alternatives keyed by content hash: twin pages from the same site
+        # template fail with the same text, so reuse the whole list
+        self._alt_cache = OrderedDict()
+        # Directories save_url_to_file has already created this run
+        self._made_dirs = set()
+        # Minimum spacing between requests derived from the rpm cap
+        self._min_interval = 60.0 / rpm if rpm else 0.0
+        self._next_call = 0.0
+        # Optional cross-run store of every domain ever generated; checked
+        # alongside the in-memory history so reruns skip known-taken names
+        self._seen_db = None
+        seen_db = seen_db or os.environ.get('DOMAIN_SEEN_DB')
+        if seen_db:
+            try:
+                self._seen_db = sqlite3.connect(seen_db)
+                self._seen_db.execute('CREATE TABLE IF NOT EXISTS seen (domain TEXT PRIMARY KEY)')
+                self._seen_db.commit()
+            except sqlite3.Error as e:
+                logger.error("Could not open seen-domains db %s: %s", seen_db, e)
+                self._seen_db = None
+
         # Simpler, more focused prompts for generating content-relevant domains
-        self.prompt_variations = [
+        self.prompt_variations = (
             "Generate a simple English word that relates to this content",
             "What's a short, common word that captures the main idea here?",
             "Pick a basic, everyday English word that represents this concept",
             "Suggest a simple domain name based on this content",
             "What short English word best summarizes this?"
-        ]
+        )
+
+    def _cache_get(self, key):
+        """Fetch a cached completion, refreshing its LRU position on hit."""
+        value = self._response_cache.get(key)
+        if value is not None:
+            self._response_cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key, value):
+        """Store a completion, evicting the least recently used entry when full."""
+        self._response_cache[key] = value
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+
+    def _reserve_slot(self) -> float:
+        """Reserve the next request slot, returning how long to wait for it."""
+        now = time.monotonic()
+        wait = self._next_call - now
+        self._next_call = max(now, self._next_call) + self._min_interval
+        return wait
+
+    def _throttle(self):
+        """Space requests to honor the configured requests-per-minute cap."""
+        if self._min_interval:
+            wait = self._reserve_slot()
+            if wait > 0:
+                time.sleep(wait)
+
+    async def _athrottle(self):
+        """Async twin of _throttle; sleeps on the event loop instead of blocking."""
+        if self._min_interval:
+            wait = self._reserve_slot()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    def _chat(self, **kwargs):
+        """Funnel for sync completions: applies the throttle, pins model/stream."""
+        self._throttle()
+        return self.client.chat.completions.create(model=self.model, stream=False, **kwargs)
+
+    async def _achat(self, **kwargs):
+        """Async twin of _chat."""
+        await self._athrottle()
+        return await self.aclient.chat.completions.create(model=self.model, stream=False, **kwargs)
+
+    def _remember_domain(self, domain: str):
+        """Record a generated domain, evicting the oldest once the history is full."""
+        if self._seen_db is not None:
+            try:
+                self._seen_db.execute('INSERT OR IGNORE INTO seen VALUES (?)', (domain,))
+                self._seen_db.commit()
+            except sqlite3.Error as e:
+                logger.error("Could not persist domain '%s': %s", domain, e)
+        if domain in self.previous_domains:
+            return
+        if len(self._recent_domains) == self._recent_domains.maxlen:
+            self.previous_domains.discard(self._recent_domains[0])
+        self._recent_domains.append(domain)
+        self.previous_domains.add(domain)
+
+    def _is_known_domain(self, domain: str) -> bool:
+        """Check the in-memory history, then the optional cross-run store."""
+        if domain in self.previous_domains:
+            return True
+        if self._seen_db is not None:
+            try:
+                return self._seen_db.execute(
+                    'SELECT 1 FROM seen WHERE domain = ?', (domain,)
+                ).fetchone() is not None
+            except sqlite3.Error:
+                pass
+        return False
     
-    def generate_url(self, text: str, custom_prompt: str = None) -> Optional[str]:
-        """
-        Generate a short, simple, memorable URL based on the given text
-        
-        Args:
-            text: Text to base domain name on
-            custom_prompt: Optional custom prompt to use instead of default
-            
-        Returns:
-            str: Generated domain name without TLD (e.g. 'example' for 'example.com')
-        """
-        # Use a higher temperature for more variety
-        temperature = random.uniform(0.7, 0.85)
-        
+    def _build_url_prompt(self, text: str, custom_prompt: str = None):
+        """Build the user prompt and temperature for a generate_url call."""
+        # Use a higher temperature for more variety. Quantized to one decimal so the
+        # exact-match response cache can actually hit on repeated inputs
+        temperature = round(self._rng.uniform(0.7, 0.85), 1)
+
         if custom_prompt:
             # Use the custom prompt if provided, injecting the text content
-            prompt = custom_prompt.replace("{TEXT}", text[:300] if "{TEXT}" in custom_prompt else text[:300])
+            prompt = custom_prompt.replace("{TEXT}", _summarize(text))
             
             # If the prompt doesn't include explicit formatting instructions, add them
             if "ONLY respond with" not in prompt and "Format your response" not in prompt:
                 prompt += "\n\nONLY respond with the domain name itself, with no explanation or commentary."
         else:
-            # Choose a prompt variation
-            prompt_prefix = random.choice(self.prompt_variations)
-            
-            # Add an explicit instruction to generate something different if we have previous domains
-            different_instruction = ""
-            if self.previous_domains:
-                different_instruction = f"Avoid these already used names: {', '.join(list(self.previous_domains)[:10])}. "
-            
-            # Improved prompt that focuses on content-relevant domain names with variable length
+            # Choose a prompt variation. The prompt is purely a function of the text -
+            # already-used names are filtered client-side from the sampled candidates,
+            # which keeps the prompt prefix stable (and provider-cacheable) across calls
+            prompt_prefix = self._rng.choice(self.prompt_variations)
+
+            # Keep the invariant text up front (system message + this fixed
+            # header) and put the varying pieces last, so providers that cache
+            # by prompt prefix get a stable prefix across calls
             prompt = (
-                f"{prompt_prefix}. {different_instruction}\n\n"
-                f"Content description:\n{text[:300]}...\n\n"
-                "Requirements for the domain name:\n"
-                "1. Must be a SINGLE word (real or invented)\n"
-                "2. Between 3-12 characters long\n"
-                "3. Must be relevant to the content\n"
-                "4. Easy to spell and pronounce\n"
-                "5. Memorable and distinctive\n\n"
-                "Examples of good domain formats: chat, mail, zoom, slack, docs, notion, eventbrite, dropbox\n\n"
-                "ONLY respond with the ONE word domain name. NO extensions, NO explanations."
+                f"Content description:\n{_summarize(text, 120)}\n\n"
+                f"{prompt_prefix}."
             )
-        
+
+        return prompt, temperature
+
+    def _url_request_kwargs(self, prompt: str, temperature: float) -> dict:
+        """Request arguments shared by the sync and async generate_url paths."""
+        return dict(
+            messages=[
+                _SYSTEM_MSG_URL,
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=20,
+            n=3,
+            top_p=0.7,
+            frequency_penalty=0.5,
+            presence_penalty=0.5
+        )
+
+    def _choose_url_domain(self, candidates, text: str, temperature: float) -> str:
+        """Pick the first usable candidate, falling back deterministically."""
+        domain = None
+        collided = None
+
+        for candidate in candidates:
+            cleaned = _clean_domain(candidate)
+            if cleaned and len(cleaned) >= 3:
+                if not self._is_known_domain(cleaned):
+                    domain = cleaned
+                    break
+                collided = collided or cleaned
+
+        if domain is None:
+            if collided:
+                # Every valid candidate was already used - better than a stub word
+                domain = collided
+            else:
+                # All three candidates were empty/too short. Short outputs are
+                # predictable garbage, so don't pay another round trip - pick a
+                # fallback word deterministically from the input text instead
+                idx = int(hashlib.blake2b(text.encode(), digest_size=4).hexdigest(), 16) % len(_FALLBACK_WORDS)
+                logger.info("No usable domain in batch, using fallback '%s'", _FALLBACK_WORDS[idx])
+                return _FALLBACK_WORDS[idx]
+
+        # Add to our history of previous domains to avoid duplicates in future calls
+        self._remember_domain(domain)
+
+        # Log the domain name prominently; %-style placeholders defer formatting
+        # until the level is actually enabled
+        logger.info("\n%s\nGENERATED DOMAIN NAME: %s (temperature: %.2f)\n%s\n",
+                    _BAR, domain, temperature, _BAR)
+
+        return domain
+
+    def generate_url(self, text: str, custom_prompt: str = None) -> Optional[str]:
+        """
+        Generate a short, simple, memorable URL based on the given text
+
+        Args:
+            text: Text to base domain name on
+            custom_prompt: Optional custom prompt to use instead of default
+
+        Returns:
+            str: Generated domain name without TLD (e.g. 'example' for 'example.com')
+        """
+        prompt, temperature = self._build_url_prompt(text, custom_prompt)
+
         try:
-            # Call the Groq API with appropriate temperature
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You create simple domain names related to the content."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=20,
-                top_p=0.7,
-                frequency_penalty=0.5,
-                presence_penalty=0.5,
-                stream=False
-            )
-            
-            # Extract the domain from the response
-            domain = response.choices[0].message.content.strip()
-            
-            # Clean up the response
-            import re
-            domain = re.sub(r'^https?://', '', domain)  # Remove http:// or https://
-            domain = re.sub(r'\.com$|\.org$|\.net$|\.io$|\.app$|\.ai$', '', domain)  # Remove any TLDs
-            domain = re.sub(r'/.*$', '', domain)  # Remove anything after the domain
-            domain = re.sub(r'[^\w\-]', '', domain)  # Remove any non-alphanumeric characters except hyphens
-            domain = domain.lower().strip()  # Lowercase and trim whitespace
-            
-            # If domain is empty or too short after cleaning, try again with a different prompt
-            if not domain or len(domain) < 3:
-                print("Generated domain was too short, trying again...")
-                # Recursive call with a more specific prompt
-                return self.generate_url("Generate a simple word for: " + text[:100])
-                
-            # Add to our set of previous domains to avoid duplicates in future calls
-            self.previous_domains.add(domain)
-            
-            # Print the domain name prominently
-            print("\n" + "=" * 50)
-            print(f"GENERATED DOMAIN NAME: {domain} (temperature: {temperature:.2f})")
-            print("=" * 50 + "\n")
-            
-            return domain
-            
+            # Return cached completions when we've seen these exact inputs before
+            cache_key = (self.model, _SYSTEM_MSG_URL["content"], prompt, temperature)
+            candidates = self._cache_get(cache_key)
+
+            if candidates is None:
+                # Sample three candidates in one request; duplicates against the
+                # domain history are filtered here rather than in the prompt
+                response = self._chat(**self._url_request_kwargs(prompt, temperature))
+
+                candidates = tuple(choice.message.content.strip() for choice in response.choices)
+                self._cache_put(cache_key, candidates)
+
+            return self._choose_url_domain(candidates, text, temperature)
+
         except Exception as e:
-            print(f"Error generating domain with Groq: {e}")
+            logger.error("Error generating domain with Groq: %s", e)
             # Generate a basic fallback if API call fails
-            return "web" + str(random.randint(100, 999))
-    
-    def generate_alternative_domains(self, failed_domain: str, original_text: str = None, count: int = 20, custom_prompt: str = None) -> List[str]:
+            return "web" + str(self._rng.randint(100, 999))
+
+    async def agenerate_url(self, text: str, custom_prompt: str = None) -> Optional[str]:
         """
-        Generate a list of alternative domain names based on the original text.
-        
+        Async twin of generate_url; independent calls can run under asyncio.gather.
+        """
+        prompt, temperature = self._build_url_prompt(text, custom_prompt)
+
+        try:
+            cache_key = (self.model, _SYSTEM_MSG_URL["content"], prompt, temperature)
+            candidates = self._cache_get(cache_key)
+
+            if candidates is None:
+                response = await self._achat(**self._url_request_kwargs(prompt, temperature))
+
+                candidates = tuple(choice.message.content.strip() for choice in response.choices)
+                self._cache_put(cache_key, candidates)
+
+            return self._choose_url_domain(candidates, text, temperature)
+
+        except Exception as e:
+            logger.error("Error generating domain with Groq: %s", e)
+            return "web" + str(self._rng.randint(100, 999))
+
+    def generate_urls(self, texts: List[str]) -> List[str]:
+        """
+        Generate domain names for several texts with one API call per batch of 16.
+
         Args:
-            failed_domain: The domain name that failed
-            original_text: The original text content to base alternatives on
-            count: Number of alternatives to generate (default: 20)
-            custom_prompt: Optional custom prompt to use instead of default
-            
+            texts: List of text contents to base domain names on
+
         Returns:
-            list: List of alternative domain names
+            list: One domain name per input text, in the same order
         """
-        print(f"Generating {count} alternatives based on original content...")
-        
-        # Generate a batch of related domain names
-        domains = []
-        temperature = 0.9  # Higher temperature for more variety in alternatives
-        
+        results = []
+
+        # Chunk large inputs so a single response stays easy to parse
+        for start in range(0, len(texts), 16):
+            batch = texts[start:start + 16]
+
+            prompt_lines = [
+                "For each description below output a single short domain name "
+                "(3-12 characters), in the same order. NO extensions.",
+                ""
+            ]
+            for i, text in enumerate(batch, 1):
+                prompt_lines.append(f"{i}. {_summarize(text, 200)}")
+
+            domains = []
+            try:
+                # JSON mode constrains decoding to one deterministic shape, so
+                # the usual stray numbering/commentary never reaches the parser
+                response = self._chat(
+                    messages=[
+                        _SYSTEM_MSG_URL_BATCH,
+                        {"role": "user", "content": "\n".join(prompt_lines)}
+                    ],
+                    temperature=0.7,
+                    max_tokens=10 * len(batch),
+                    response_format={"type": "json_object"}
+                )
+
+                body = response.choices[0].message.content
+                try:
+                    domains.extend(_clean_domain(d) for d in json.loads(body)["domains"])
+                except (ValueError, KeyError, TypeError):
+                    # Model ignored the JSON shape - fall back to line parsing
+                    domains.extend(_parse_domain_words(body))
+            except Exception as e:
+                logger.error("Error generating domain batch with Groq: %s", e)
+
+            # Pad or repair with per-item generation so output lines up with input
+            domains = domains[:len(batch)]
+            for i, text in enumerate(batch):
+                if i < len(domains) and len(domains[i]) >= 3:
+                    self._remember_domain(domains[i])
+                    continue
+                repaired = self.generate_url(text)
+                if i < len(domains):
+                    domains[i] = repaired
+                else:
+                    domains.append(repaired)
+
+            results.extend(domains)
+
+        return results
+
+    def _build_alternatives_prompt(self, failed_domain: str, original_text: str = None, custom_prompt: str = None) -> str:
+        """Build the user prompt for an alternative-domains call."""
         if custom_prompt:
             # Use the custom prompt if provided, injecting the failed domain and text content
             prompt = custom_prompt
             prompt = prompt.replace("{FAILED_DOMAIN}", failed_domain)
-            prompt = prompt.replace("{TEXT}", original_text[:400] if original_text and "{TEXT}" in prompt else "")
-            prompt = prompt.replace("{COUNT}", str(count))
-            
+            prompt = prompt.replace("{TEXT}", _summarize(original_text) if original_text and "{TEXT}" in prompt else "")
+            prompt = prompt.replace("{COUNT}", "1")
+
             # If the prompt doesn't include explicit formatting instructions, add them
             if "Format your response" not in prompt:
-                prompt += (
-                    f"\n\nFormat your response as a simple list of {count} domain names, "
-                    "each on a separate line, with no explanations or numbering."
-                )
+                prompt += "\n\nONLY respond with a single domain name, with no explanation or numbering."
         else:
             if original_text:
-                # Extract key topics from the text first to focus the domain generation
-                key_topics = self._extract_key_topics(original_text)
-                text_to_use = original_text[:400]  # Shorter text to focus on main content
-                
-                # Create a more focused prompt that emphasizes relevance to the content
                 prompt = (
-                    f"The domain name '{failed_domain}' was already taken. Generate {count} highly relevant "
-                    f"alternative domain names directly related to this content:\n\n"
-                    f"\"{text_to_use}\"\n\n"
-                    f"Key topics identified in this content: {key_topics}\n\n"
-                    "Requirements for each domain name:\n"
-                    "1. Single words directly related to the content\n"
-                    "2. Mix of short (3-6 characters) and longer (7-12 characters) names\n"
-                    "3. Must strongly connect to the main topic or purpose of the content\n"
-                    "4. Easy to spell and remember\n"
-                    "5. Focus on words that capture what the website actually does or offers\n"
-                    "6. Each name should reflect a different aspect of the content\n\n"
-                    "Format your response as a numbered list, with each item being only the domain name:\n"
-                    "1. chat\n2. mail\n3. web\n... and so on."
+                    f"The domain name '{failed_domain}' was already taken. Give ONE short English word "
+                    f"(3-12 characters) that would work as a domain name for this content:\n\n"
+                    f"\"{_summarize(original_text)}\"\n\n"
+                    "ONLY respond with the single word. NO extensions, NO explanations."
                 )
             else:
                 prompt = (
-                    f"The domain name '{failed_domain}' was already taken. Generate {count} alternative "
-                    "domain names that are simple English words or made-up terms.\n\n"
-                    "Requirements for each domain name:\n"
-                    "1. Mix of short (3-6 chars) and longer (7-12 chars) names\n"
-                    "2. Easy to spell and remember\n"
-                    "3. Related to the concept suggested by '{failed_domain}'\n\n"
-                    "Format your response as a numbered list, with each item being only the domain name:\n"
-                    "1. chat\n2. mail\n3. web\n... and so on."
-                )
-        
-        try:
-            # Call the API with modified parameters for more relevant results
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You generate diverse domain names with a mix of lengths (short to medium-long)."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=250,
-                top_p=0.9,
-                frequency_penalty=0.6,
-                presence_penalty=0.6,
-                stream=False
-            )
-            
-            # Process the response
-            response_text = response.choices[0].message.content.strip()
-            
-            # Parse the list - look for numbered items or separate entries
-            import re
-            
-            # Try to find entries with "1. domain" pattern first
-            numbered_items = re.findall(r'\d+[\.\)]\s*([a-zA-Z0-9\-]+)', response_text)
-            if numbered_items:
-                for domain in numbered_items:
-                    clean_domain = domain.strip().lower()
-                    # Basic validation
-                    if clean_domain and len(clean_domain) >= 3 and clean_domain != failed_domain:
-                        domains.append(clean_domain)
-                        self.previous_domains.add(clean_domain)
-            else:
-                # Fall back to splitting on newlines or commas
-                for item in re.split(r'[\n,]', response_text):
-                    # Clean and extract domain name, ignoring numbers/bullets
-                    clean_domain = re.sub(r'^\d+[\.\)]?\s*', '', item).strip().lower()
-                    clean_domain = re.sub(r'[^\w\-]', '', clean_domain)
-                    
-                    if clean_domain and len(clean_domain) >= 3 and clean_domain != failed_domain:
-                        domains.append(clean_domain)
-                        self.previous_domains.add(clean_domain)
-            
-            # If we didn't get enough domains, try another approach with topic extraction
-            if len(domains) < count and original_text:
-                # Second attempt with more topic-focused approach
-                second_prompt = (
-                    f"Based on this text:\n\n\"{original_text[:300]}\"\n\n"
-                    f"What are {count - len(domains)} words that best describe "
-                    f"the core purpose, functionality, or main topic of this website? "
-                    f"Mix of short (3-6 letters) and longer (7-12 letters) names. "
-                    f"Focus on words that would make good domain names directly related to what this service actually does.\n"
-                    f"Just list the words one per line, no explanations."
+                    f"The domain name '{failed_domain}' was already taken. Give ONE short English word "
+                    "(3-12 characters) related to that concept that would work as a domain name.\n\n"
+                    "ONLY respond with the single word. NO extensions, NO explanations."
                 )
-                
-                second_response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You generate very short domain names."},
-                        {"role": "user", "content": second_prompt}
-                    ],
-                    temperature=0.5,
-                    max_tokens=100,
-                    stream=False
-                )
-                
-                second_text = second_response.choices[0].message.content.strip()
-                
-                # Process each line
-                for line in second_text.split('\n'):
-                    word = line.strip().lower()
-                    word = re.sub(r'[^\w\-]', '', word)
-                    
-                    if word and len(word) >= 3 and word not in domains and word != failed_domain:
-                        domains.append(word)
-                        self.previous_domains.add(word)
-                        
-                        if len(domains) >= count:
-                            break
-        
-        except Exception as e:
-            print(f"Error generating alternative domains: {e}")
-        
+
+        return prompt
+
+    def _alternatives_request_kwargs(self, prompt: str, count: int) -> dict:
+        """Request arguments shared by the sync and async alternatives paths."""
+        return dict(
+            messages=[
+                _SYSTEM_MSG_ALT,
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=8,
+            # Over-provision by half so dedup/cleanup losses still leave
+            # ~count usable words without a second request
+            n=count + count // 2,
+            frequency_penalty=0.7,
+            presence_penalty=0.6
+        )
+
+    def _collect_alternatives(self, contents, failed_domain: str, count: int) -> List[str]:
+        """Clean, dedupe and top up the sampled alternative message bodies."""
+        # The set mirrors the list so dedup checks stay O(1) instead of
+        # scanning the list per candidate.
+        domains = []
+        seen = {failed_domain}
+
+        def add(word, remember=False):
+            if word not in seen:
+                seen.add(word)
+                domains.append(word)
+                if remember:
+                    self._remember_domain(word)
+
+        for content in contents:
+            # Each choice should be one word, but tolerate stray numbering/lines
+            for clean_domain in _parse_domain_words(content):
+                if len(clean_domain) >= 3:
+                    add(clean_domain, remember=True)
+
         # If we still don't have enough domains, add some basic generic ones
         if len(domains) < count:
-            generic_domains = [
-                'web', 'app', 'site', 'page', 'link', 'net', 'hub', 'spot', 'zone', 'home',
-                'go', 'get', 'try', 'use', 'view', 'find', 'info', 'help', 'talk', 'meet'
-            ]
-            needed = count - len(domains)
-            for i in range(min(needed, len(generic_domains))):
-                word = generic_domains[i]
-                if word not in domains and word != failed_domain:
-                    domains.append(word)
-        
+            for word in _GENERIC_DOMAINS:
+                add(word)
+                if len(domains) >= count:
+                    break
+
         # Limit to the requested count
         domains = domains[:count]
-        
-        # Print the list of alternatives
-        print("\n" + "=" * 50)
-        print(f"ALTERNATIVE DOMAIN NAMES FOR '{failed_domain}':")
-        for i, domain in enumerate(domains, 1):
-            print(f"{i}. {domain}")
-        print("=" * 50 + "\n")
-        
+
+        # Log the list of alternatives as a single deferred-format record
+        if logger.isEnabledFor(logging.INFO):
+            listing = "\n".join(f"{i}. {domain}" for i, domain in enumerate(domains, 1))
+            logger.info("\n%s\nALTERNATIVE DOMAIN NAMES FOR '%s':\n%s\n%s\n",
+                        _BAR, failed_domain, listing, _BAR)
+
+        return domains
+
+    def _alt_cache_key(self, failed_domain, original_text, count, custom_prompt):
+        """Content-hash cache key for an alternatives call, or None if uncacheable."""
+        if not original_text or custom_prompt:
+            return None
+        text_hash = hashlib.blake2b(original_text[:400].encode(), digest_size=16).hexdigest()
+        return (text_hash, failed_domain, count)
+
+    def _alt_cache_store(self, cache_key, contents, domains):
+        """Cache a successful alternatives result, LRU-evicting past 1024 entries."""
+        if cache_key is None or not contents:
+            return
+        self._alt_cache[cache_key] = tuple(domains)
+        if len(self._alt_cache) > 1024:
+            self._alt_cache.popitem(last=False)
+
+    def generate_alternative_domains(self, failed_domain: str, original_text: str = None, count: int = 20, custom_prompt: str = None) -> List[str]:
+        """
+        Generate a list of alternative domain names based on the original text.
+
+        Args:
+            failed_domain: The domain name that failed
+            original_text: The original text content to base alternatives on
+            count: Number of alternatives to generate (default: 20)
+            custom_prompt: Optional custom prompt to use instead of default
+
+        Returns:
+            list: List of alternative domain names
+        """
+        logger.info("Generating %d alternatives based on original content...", count)
+
+        cache_key = self._alt_cache_key(failed_domain, original_text, count, custom_prompt)
+        if cache_key is not None:
+            cached = self._alt_cache.get(cache_key)
+            if cached is not None:
+                self._alt_cache.move_to_end(cache_key)
+                return list(cached)
+
+        prompt = self._build_alternatives_prompt(failed_domain, original_text, custom_prompt)
+        contents = []
+
+        try:
+            # One request with n=count completions - each choice comes back as a single
+            # short word, so there is no numbered list to parse and no second retry call
+            response = self._chat(**self._alternatives_request_kwargs(prompt, count))
+            contents = [choice.message.content for choice in response.choices]
+        except Exception as e:
+            logger.error("Error generating alternative domains: %s", e)
+
+        domains = self._collect_alternatives(contents, failed_domain, count)
+        self._alt_cache_store(cache_key, contents, domains)
+        return domains
+
+    async def agenerate_alternative_domains(self, failed_domain: str, original_text: str = None, count: int = 20, custom_prompt: str = None) -> List[str]:
+        """
+        Async twin of generate_alternative_domains for use under asyncio.gather.
+        """
+        logger.info("Generating %d alternatives based on original content...", count)
+
+        cache_key = self._alt_cache_key(failed_domain, original_text, count, custom_prompt)
+        if cache_key is not None:
+            cached = self._alt_cache.get(cache_key)
+            if cached is not None:
+                self._alt_cache.move_to_end(cache_key)
+                return list(cached)
+
+        prompt = self._build_alternatives_prompt(failed_domain, original_text, custom_prompt)
+        contents = []
+
+        try:
+            response = await self._achat(**self._alternatives_request_kwargs(prompt, count))
+            contents = [choice.message.content for choice in response.choices]
+        except Exception as e:
+            logger.error("Error generating alternative domains: %s", e)
+
+        domains = self._collect_alternatives(contents, failed_domain, count)
+        self._alt_cache_store(cache_key, contents, domains)
         return domains
     
-    def _extract_key_topics(self, text: str) -> str:
+    def generate_alternative_domains_batched(self, failures: List[tuple], count: int = 20,
+                                             timeout: float = 600.0, poll_interval: float = 10.0) -> dict:
         """
-        Extract key topics from the text to help focus domain name generation.
-        
+        Generate alternatives for many failed domains via Groq's Batch API.
+
+        Batch requests are billed at a discount and run off the interactive
+        path, so this suits bulk regeneration after a full scan rather than
+        the in-dialog retry loop. If the batch is not done within `timeout`
+        seconds it is cancelled and each failure falls back to the sync path.
+
         Args:
-            text: The text to extract topics from
-            
+            failures: List of (failed_domain, original_text) pairs
+            count: Number of alternatives per failed domain (default: 20)
+            timeout: Seconds to wait for the batch before falling back
+            poll_interval: Seconds between batch status polls
+
         Returns:
-            str: Comma-separated list of key topics
+            dict: Mapping of each failed domain to its list of alternatives
         """
+        results = {}
+        if not failures:
+            return results
+
+        lines = []
+        for failed_domain, original_text in failures:
+            prompt = self._build_alternatives_prompt(failed_domain, original_text)
+            lines.append(json.dumps({
+                "custom_id": failed_domain,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": dict(self._alternatives_request_kwargs(prompt, count), model=self.model)
+            }))
+
         try:
-            # Use Groq to extract key topics from the content
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You identify the core topics and purpose of content."},
-                    {"role": "user", "content": f"From this text, identify 5-7 key topics or themes that represent what this website/app is about. Respond with ONLY the topics as a comma-separated list of single words or short phrases:\n\n{text[:500]}"}
-                ],
-                temperature=0.1,
-                max_tokens=50,
-                stream=False
+            batch_file = self.client.files.create(
+                file=("alternatives.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
             )
-            
-            topics = response.choices[0].message.content.strip()
-            print(f"Extracted key topics: {topics}")
-            return topics
-            
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    self.client.batches.cancel(batch.id)
+                    raise TimeoutError(f"batch {batch.id} not finished within {timeout:.0f}s")
+                time.sleep(poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed":
+                raise RuntimeError(f"batch {batch.id} ended with status '{batch.status}'")
+
+            output = self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                failed_domain = record["custom_id"]
+                contents = [choice["message"]["content"]
+                            for choice in record["response"]["body"]["choices"]]
+                results[failed_domain] = self._collect_alternatives(contents, failed_domain, count)
         except Exception as e:
-            print(f"Error extracting topics: {e}")
-            return "website, application, service, platform, tool"
-    
+            logger.error("Batch alternative generation failed (%s); falling back to sync calls", e)
+
+        # Cover anything the batch did not deliver with the interactive path
+        for failed_domain, original_text in failures:
+            if failed_domain not in results:
+                results[failed_domain] = self.generate_alternative_domains(
+                    failed_domain, original_text, count
+                )
+
+        return results
+
     def save_url_to_file(self, url: str, filename: str) -> bool:
         """
         Save the generated URL to a file
@@ -333,17 +716,45 @@ class GroqProcessor:
             bool: True if successful, False otherwise
         """
         try:
-            # Create directory if it doesn't exist
-            directory = os.path.dirname(filename)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            # Write URL to file
-            with open(filename, 'w', encoding='utf-8') as file:
-                file.write(url)
-                
-            print(f"Successfully saved domain name to {filename}")
+            # Create the directory once per instance; later writes into the
+            # same place skip the mkdir/stat syscalls entirely
+            path = Path(filename)
+            if path.parent != Path('') and path.parent not in self._made_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._made_dirs.add(path.parent)
+
+            path.write_text(url, encoding='utf-8')
+
+            logger.info("Successfully saved domain name to %s", filename)
             return True
-        except Exception as e:
-            print(f"Failed to save domain name to file: {e}")
+        except OSError as e:
+            logger.error("Failed to save domain name to file: %s", e)
             return False
+
+    async def asave_url_to_file(self, url: str, filename: str) -> bool:
+        """
+        Async twin of save_url_to_file; runs the blocking write in a worker
+        thread so the event loop keeps servicing in-flight Groq calls.
+        """
+        return await asyncio.to_thread(self.save_url_to_file, url, filename)
+
+    def save_urls_to_file(self, pairs: List[tuple]) -> int:
+        """
+        Save many (url, filename) pairs in one pass.
+
+        The per-directory mkdir memoization means a whole batch landing in one
+        output directory pays its directory syscalls exactly once.
+
+        Args:
+            pairs: Iterable of (url, filename) tuples
+
+        Returns:
+            int: Number of files written successfully
+        """
+        return sum(1 for url, filename in pairs if self.save_url_to_file(url, filename))
+
+    async def asave_urls_to_file(self, pairs: List[tuple]) -> int:
+        """Async twin of save_urls_to_file; writes run concurrently in worker threads."""
+        results = await asyncio.gather(*[self.asave_url_to_file(url, filename)
+                                         for url, filename in pairs])
+        return sum(results)
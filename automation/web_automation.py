@@ -1,72 +1,187 @@
+import atexit
+import re
+import threading
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
 
+# Directories already created by the save helpers this process
+_MKDIR_CACHE = set()
+
+# Resource patterns blocked via CDP when block_resources is on - the
+# automation only reads text, so images/fonts/analytics are dead weight
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*/analytics/*", "*/gtag/*", "*googletagmanager*",
+)
+
+# Selector cascade for locating the first chat message, in priority order
+_CHAT_MESSAGE_SELECTORS = (
+    ".ChatMessageContainer",
+    "[data-message-id]",
+    ".prose", ".prose-markdown", ".break-anywhere", ".whitespace-pre-wrap",
+    ".message-content", ".chat-message", ".user-message",
+)
+
+# Runs the whole fallback cascade browser-side in one round trip: the first
+# selector with a non-empty match wins, then any text under main > p as a
+# last resort
+_EXTRACT_MESSAGE_JS = r"""
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    if (el && el.innerText && el.innerText.trim()) {
+        return el.innerText;
+    }
+}
+const parts = Array.from(document.querySelectorAll('main p'))
+    .map(p => p.innerText).filter(Boolean);
+return parts.length ? parts.join('\n') : null;
+"""
+
 class WebsiteAutomation:
     """Core automation class for web interactions."""
-    
-    def __init__(self, url, headless=False, position_right=True):
-        """Initialize the automation with the target website URL."""
+
+    # Chromedriver binary path, resolved once per process so repeated
+    # instantiation skips webdriver_manager's version probe
+    _driver_path = None
+    # Default console-error pattern, compiled once; one case-insensitive scan
+    # replaces lowercasing the message and testing each keyword separately
+    _DEFAULT_ERROR_RE = re.compile(r'error|exception|fail|already|taken|exists', re.IGNORECASE)
+    # Idle browsers parked by quit() for the next instance to adopt,
+    # keyed by the options that built them; the lock keeps adopt/park
+    # atomic when run_in_parallel drives the pool from worker threads
+    _driver_pool = {}
+    _pool_lock = threading.Lock()
+
+    def __init__(self, url, headless=False, position_right=True, block_resources=True, debug=False):
+        """Initialize the automation with the target website URL.
+
+        The browser itself is not started here: Chrome spins up (or is
+        adopted from the pool) on first use of self.driver, so instances
+        built for configuration or inspection cost nothing.
+
+        block_resources stops images, webfonts and analytics from ever being
+        downloaded; pass False when screenshots need the full page.
+        debug enables success-path screenshots (failure-path screenshots are
+        always taken for post-mortems).
+        """
+        self.debug = debug
         self.url = url
+        self._position_right = position_right
+        self._block_resources = block_resources
         self.options = Options()
         if headless:
             self.options.add_argument("--headless")
-        
+
         # Enable browser logging
         self.options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-        
+
         # Performance optimizations
         self.options.add_argument("--no-sandbox")
         self.options.add_argument("--disable-dev-shm-usage")
         self.options.add_argument("--disable-extensions")
         self.options.add_argument("--disable-gpu")
         self.options.add_argument("--disable-infobars")
-        self.options.page_load_strategy = 'eager'  # Don't wait for all resources
-        
-        # Initialize the WebDriver
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=self.options
-        )
-        
+        self.options.page_load_strategy = 'none'  # Return from get() immediately; readiness is waited for explicitly
+
+        self._pool_key = (headless,)
+        self._driver = None
+
+        # Extracted-message cache keyed by a DOM fingerprint; back-to-back
+        # extract calls on an unchanged page skip the browser entirely
+        self._extract_cache = {}
+        # Located elements keyed by (by, value); repeat lookups of the same
+        # locator skip the wait-and-find round trip until the next navigation
+        self._element_cache = {}
+        # Archive of every console entry drained so far; get_log only ever
+        # returns the delta, so history must be kept client-side
+        self._log_buffer = []
+
+    @property
+    def driver(self):
+        """The underlying WebDriver, created lazily on first access."""
+        if self._driver is None:
+            self._ensure_driver()
+        return self._driver
+
+    def _ensure_driver(self):
+        """Adopt a pooled browser or start Chrome, then apply window/CDP setup."""
+        if self._driver is not None:
+            return
+
+        # Adopt a pooled browser when a compatible one is parked; otherwise
+        # pay the chromedriver/Chrome startup cost once and remember the path
+        with WebsiteAutomation._pool_lock:
+            pooled = WebsiteAutomation._driver_pool.get(self._pool_key)
+            if pooled:
+                self._driver = pooled.pop()
+        if self._driver is not None:
+            print("Reusing pooled browser session")
+        else:
+            if WebsiteAutomation._driver_path is None:
+                # CHROMEDRIVER_PATH skips webdriver_manager entirely - no
+                # filesystem probe or version check on first startup
+                WebsiteAutomation._driver_path = (
+                    os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+                )
+            self._driver = webdriver.Chrome(
+                service=Service(WebsiteAutomation._driver_path),
+                options=self.options
+            )
+
         # Set window size and position
         # Modified browser window size - taller and narrower
         width = 1024  # Narrower width (reduced from 1200)
         height = 1300  # Taller height (increased from 800)
-        
+
         # Position to the right side of the screen if requested
-        if position_right:
+        if self._position_right:
             # Get screen resolution (approximate common screen width)
-            screen_width = 3024  
+            screen_width = 3024
             x_position = int(screen_width * 1/4)
             y_position = 0  # Top of the screen
-            
+
             # Set window position and size
-            self.driver.set_window_size(width, height)
-            self.driver.set_window_position(x_position, y_position)
+            self._driver.set_window_size(width, height)
+            self._driver.set_window_position(x_position, y_position)
             print(f"Positioned browser window on right side of screen ({width}x{height})")
         else:
             # Still apply the size change when positioned on the left
-            self.driver.set_window_size(width, height)
+            self._driver.set_window_size(width, height)
             print(f"Set browser window size to {width}x{height}")
-        
+
+        # Applied (or cleared, for adopted pooled browsers) on every init so
+        # the flag always reflects this instance's choice
+        try:
+            self._driver.execute_cdp_cmd("Network.enable", {})
+            self._driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                "urls": list(_BLOCKED_URL_PATTERNS) if self._block_resources else []
+            })
+        except Exception as e:
+            print(f"Could not configure resource blocking: {e}")
+
         # Set page load timeout - reduced from 15 seconds
-        self.driver.set_page_load_timeout(10)
+        self._driver.set_page_load_timeout(10)
         # Set default script timeout - reduced from 10 seconds
-        self.driver.set_script_timeout(7)
-    
+        self._driver.set_script_timeout(7)
+
     # Core navigation methods
     def start(self):
         """Start the browser and navigate to the website."""
         try:
+            self._extract_cache.clear()
+            self._element_cache.clear()
             self.driver.get(self.url)
+            self._wait_for_page_ready(timeout=15)
             print(f"Successfully navigated to {self.url}")
         except Exception as e:
             print(f"Failed to navigate to {self.url}: {e}")
@@ -84,10 +199,13 @@ class WebsiteAutomation:
         """
         try:
             print(f"Navigating to {url}")
+            self._extract_cache.clear()
+            self._element_cache.clear()
             self.driver.get(url)
-            
-            # Wait briefly - reduced from 2 seconds
-            time.sleep(1.5)
+
+            # Wait for readiness instead of a fixed sleep; fast pages proceed
+            # in milliseconds rather than idling the full interval
+            self._wait_for_page_ready()
             
             # Verify we reached the intended URL or at least the right domain
             current_url = self.driver.current_url
@@ -107,10 +225,12 @@ class WebsiteAutomation:
                 if current_url == "https://lovable.dev/" and "projects" in url:
                     print("Detected redirection to homepage. Trying direct navigation again...")
                     self.driver.get(url)
-                    time.sleep(3)
-                    
-                    if url in self.driver.current_url or "projects" in self.driver.current_url:
-                        print(f"Second navigation attempt successful. Now at: {self.driver.current_url}")
+                    self._wait_for_page_ready(timeout=5)
+
+                    # One remote read instead of three; each access is a command
+                    current_url = self.driver.current_url
+                    if url in current_url or "projects" in current_url:
+                        print(f"Second navigation attempt successful. Now at: {current_url}")
                         return True
                 
                 return False
@@ -119,13 +239,36 @@ class WebsiteAutomation:
             print(f"Failed to navigate to {url}: {e}")
             return False
     
+    def _wait_for_page_ready(self, timeout=10):
+        """Wait until the app shell (a main element) is usable, instead of sleeping.
+
+        With page_load_strategy='none', get() returns immediately; this is
+        the only gate between navigation and the first element access.
+        """
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(
+                    "return document.readyState !== 'loading'"
+                    " && document.querySelector('main') !== null"
+                )
+            )
+        except TimeoutException:
+            # Not every page has a main element; proceed with whatever has
+            # rendered rather than failing here
+            pass
+
     def get_current_url(self):
         """Get the current URL of the browser."""
         return self.driver.current_url
     
-    def is_on_correct_page(self, expected_url):
-        """Check if we're on the expected page or at least on a project page."""
-        current_url = self.driver.current_url
+    def is_on_correct_page(self, expected_url, current_url=None):
+        """Check if we're on the expected page or at least on a project page.
+
+        Callers that already fetched driver.current_url can pass it to avoid
+        a second remote read.
+        """
+        if current_url is None:
+            current_url = self.driver.current_url
         
         if current_url == expected_url:
             return True
@@ -137,18 +280,41 @@ class WebsiteAutomation:
         return False
     
     def quit(self):
-        """Close the browser and end the session."""
-        if self.driver:
-            self.driver.quit()
-            print("Browser session ended")
+        """Park the browser for reuse by the next instance; see shutdown_pool()."""
+        if self._driver:
+            try:
+                # Scrub session state so the next adopter starts clean
+                self._driver.delete_all_cookies()
+                self._driver.get("about:blank")
+            except Exception as e:
+                print(f"Browser unhealthy on release ({e}), closing it")
+                self._driver.quit()
+            else:
+                with WebsiteAutomation._pool_lock:
+                    WebsiteAutomation._driver_pool.setdefault(self._pool_key, []).append(self._driver)
+                print("Browser session parked for reuse")
+            self._driver = None
     
     # Element interaction methods
     def wait_for_element(self, by, value, timeout=3):  # Default timeout reduced from 5
         """Wait for an element to be present on the page."""
+        cached = self._element_cache.get((by, value))
+        if cached is not None:
+            try:
+                # Cheap liveness probe: raises if the SPA re-rendered the
+                # element in place (no navigation, so no cache clear happened)
+                cached.is_enabled()
+                return cached
+            except StaleElementReferenceException:
+                self._element_cache.pop((by, value), None)
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            # Poll at 100ms instead of the default 500ms: elements that appear
+            # quickly are returned almost immediately instead of up to half a
+            # second late, without the mixed-wait pitfalls of implicit waits
+            element = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
                 EC.presence_of_element_located((by, value))
             )
+            self._element_cache[(by, value)] = element
             return element
         except TimeoutException:
             print(f"Timed out waiting for element {value}")
@@ -159,7 +325,16 @@ class WebsiteAutomation:
         element = self.wait_for_element(by, value, timeout)
         if element:
             try:
-                element.click()
+                try:
+                    element.click()
+                except StaleElementReferenceException:
+                    # Cached element went stale (page re-rendered): purge and
+                    # re-resolve once
+                    self._element_cache.pop((by, value), None)
+                    element = self.wait_for_element(by, value, timeout)
+                    if not element:
+                        return False
+                    element.click()
                 print(f"Clicked element {value}")
                 return True
             except Exception as e:
@@ -167,14 +342,28 @@ class WebsiteAutomation:
                 return False
         return False
     
+    def _fast_type(self, element, text):
+        """
+        Set an input's value with one script call instead of per-key events.
+
+        send_keys costs a WebDriver command per character; this writes the
+        whole value at once and fires input/change so framework listeners
+        still see the update.
+        """
+        self.driver.execute_script(
+            "arguments[0].value = arguments[1];"
+            " arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            " arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+            element, text
+        )
+
     def fill_form(self, field_dict):
         """Fill out form fields."""
         for locator, value in field_dict.items():
             try:
                 field = self.wait_for_element(locator[0], locator[1])
                 if field:
-                    field.clear()
-                    field.send_keys(value)
+                    self._fast_type(field, value)
                     print(f"Filled field {locator[1]} with value")
             except Exception as e:
                 print(f"Failed to fill field {locator[1]}: {e}")
@@ -182,30 +371,49 @@ class WebsiteAutomation:
     def quick_login(self, email, password):
         """Optimized method to quickly perform login."""
         try:
-            # Quick fill email
+            # One lookup to confirm the form rendered, then a single script
+            # fills both credentials (with input/change events) in one round
+            # trip instead of separate waits and fills per field
             email_field = self.wait_for_element(By.ID, 'email')
-            if email_field:
-                email_field.clear()
-                email_field.send_keys(email)
-            
-            # Quick fill password
-            password_field = self.wait_for_element(By.ID, 'password')
-            if password_field:
-                password_field.clear()
-                password_field.send_keys(password)
-            
-            # Find the exact sign-in button using the class from HTML
-            sign_in_button = self.wait_for_element(
-                By.XPATH, 
-                "//button[contains(@class, 'bg-primary') and contains(text(), 'Sign in')]"
+            if not email_field:
+                return False
+
+            self.driver.execute_script(
+                "var fill = function(id, value) {"
+                "  var el = document.getElementById(id);"
+                "  if (el) {"
+                "    el.value = value;"
+                "    el.dispatchEvent(new Event('input', {bubbles: true}));"
+                "    el.dispatchEvent(new Event('change', {bubbles: true}));"
+                "  }"
+                "};"
+                " fill('email', arguments[0]);"
+                " fill('password', arguments[1]);",
+                email, password
             )
             
-            if sign_in_button:
-                sign_in_button.click()
-                print("Clicked Sign in button")
-                return True
-            
-            return False
+            # CSS class matching uses the browser's indexed fast path; the
+            # old XPath contains() on class and text scanned the whole DOM
+            sign_in_button = self.wait_for_element(By.CSS_SELECTOR, "button.bg-primary")
+
+            if not sign_in_button:
+                return False
+
+            # Require the 'Sign in' label: several primary buttons can match
+            # (e.g. "Sign up"), and clicking an arbitrary one is worse than
+            # failing the login
+            if 'Sign in' not in sign_in_button.text:
+                sign_in_button = self.driver.execute_script(
+                    "return Array.from(document.querySelectorAll('button.bg-primary'))"
+                    ".find(b => b.innerText.includes('Sign in')) || null;"
+                )
+                if not sign_in_button:
+                    print("No primary button labelled 'Sign in' found")
+                    return False
+
+            sign_in_button.click()
+            print("Clicked Sign in button")
+            return True
         except Exception as e:
             print(f"Login failed: {e}")
             return False
@@ -220,10 +428,12 @@ class WebsiteAutomation:
                 
             text_content = element.text
             
-            # Create directory if it doesn't exist
+            # exist_ok folds the exists-check and creation into one racefree
+            # call, and the cache skips even that after the first write
             directory = os.path.dirname(filename)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
+            if directory and directory not in _MKDIR_CACHE:
+                os.makedirs(directory, exist_ok=True)
+                _MKDIR_CACHE.add(directory)
                 
             # Write content to file
             with open(filename, 'w', encoding='utf-8') as file:
@@ -235,197 +445,104 @@ class WebsiteAutomation:
             print(f"Failed to save element text: {e}")
             return False
             
-    def extract_chat_message(self, filename):
+    def _extract_first_message(self):
         """
-        Extract the first chat message using multiple methods as fallbacks.
-        
+        Run the whole selector cascade in the browser with one script call.
+
+        Returns:
+            str: Extracted text content or None if nothing matched
+        """
+        try:
+            # Fingerprint is far cheaper over the wire than the full text, so
+            # repeated extraction on an unchanged DOM costs one tiny command
+            key = tuple(self.driver.execute_script(
+                "return [document.URL,"
+                " document.body ? document.body.innerText.length : 0,"
+                " (function(){var m = document.querySelector('[data-message-id]:last-child');"
+                "  return m ? m.getAttribute('data-message-id') : null;})()]"
+            ))
+            cached = self._extract_cache.get(key)
+            if cached is not None:
+                return cached
+
+            text_content = self.driver.execute_script(_EXTRACT_MESSAGE_JS, list(_CHAT_MESSAGE_SELECTORS))
+            if text_content:
+                # Only the current page's state is worth keeping
+                self._extract_cache = {key: text_content}
+            return text_content
+        except Exception as e:
+            print(f"Error extracting chat message: {e}")
+            return None
+
+    def extract_chat_message(self, filename, debug=None):
+        """
+        Extract the first chat message and save it to a file.
+
         Args:
             filename: The file to save the first chat message to
-            
+            debug: Take a pre-extraction screenshot; defaults to the
+                instance-wide debug flag
+
         Returns:
             bool: True if successful, False otherwise
         """
         print("Attempting to extract chat message...")
-        
-        # Take a screenshot before attempting extraction (helpful for debugging)
-        pre_extract_screenshot = os.path.splitext(filename)[0] + "_pre_extract.png"
-        try:
-            self.driver.save_screenshot(pre_extract_screenshot)
-            print(f"Saved pre-extraction screenshot to {pre_extract_screenshot}")
-        except Exception as e:
-            print(f"Could not save pre-extraction screenshot: {e}")
-        
-        # Try multiple methods to find chat messages
+
+        if debug is None:
+            debug = self.debug
+
+        # Screenshot capture serializes the viewport to PNG and ships it over
+        # the wire - only worth it when explicitly debugging
+        if debug:
+            pre_extract_screenshot = os.path.splitext(filename)[0] + "_pre_extract.png"
+            try:
+                self.driver.save_screenshot(pre_extract_screenshot)
+                print(f"Saved pre-extraction screenshot to {pre_extract_screenshot}")
+            except Exception as e:
+                print(f"Could not save pre-extraction screenshot: {e}")
+
+        text_content = self._extract_first_message()
+        if text_content:
+            self._save_text_to_file(text_content, filename)
+            return True
+
+        # Take a screenshot for debugging
         try:
-            # Method 1: Look for ChatMessageContainer class directly (most reliable)
-            print("Method 1: Looking for ChatMessageContainer elements...")
-            message_containers = self.driver.find_elements(By.CSS_SELECTOR, ".ChatMessageContainer")
-            
-            if message_containers:
-                print(f"Found {len(message_containers)} message containers")
-                # Get the first container (oldest message)
-                text_content = message_containers[0].text
-                if text_content:
-                    self._save_text_to_file(text_content, filename)
-                    return True
-            else:
-                print("No ChatMessageContainer elements found")
-                
-            # Method 2: Look for any elements with data-message-id attribute
-            print("Method 2: Looking for elements with data-message-id...")
-            message_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-message-id]")
-            
-            if message_elements:
-                print(f"Found {len(message_elements)} message elements with data-message-id")
-                # Get the first one
-                text_content = message_elements[0].text
-                if text_content:
-                    self._save_text_to_file(text_content, filename)
-                    return True
-            else:
-                print("No elements with data-message-id found")
-                
-            # Method 3: Look for message content by class names often used in chat interfaces
-            print("Method 3: Looking for message content by class names...")
-            content_classes = [
-                ".prose", ".prose-markdown", ".break-anywhere", ".whitespace-pre-wrap", 
-                ".message-content", ".chat-message", ".user-message"
-            ]
-            
-            for class_selector in content_classes:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, class_selector)
-                if elements:
-                    print(f"Found {len(elements)} elements with selector {class_selector}")
-                    text_content = elements[0].text
-                    if text_content:
-                        self._save_text_to_file(text_content, filename)
-                        return True
-            
-            # Method 4: Last resort - take any visible text from the main area
-            print("Method 4: Taking screenshot and looking for any visible text...")
-            
-            # Look for main content area using a more general selector
-            main_areas = self.driver.find_elements(By.CSS_SELECTOR, "main")
-            if main_areas:
-                for main in main_areas:
-                    try:
-                        # Get all paragraph elements
-                        paragraphs = main.find_elements(By.TAG_NAME, "p")
-                        if paragraphs:
-                            # Collect text from all paragraphs
-                            all_text = "\n".join([p.text for p in paragraphs if p.text])
-                            if all_text:
-                                self._save_text_to_file(all_text, filename)
-                                return True
-                    except Exception as e:
-                        print(f"Error extracting paragraphs: {e}")
-            
-            # Take a screenshot for debugging
             debug_screenshot = os.path.splitext(filename)[0] + "_debug.png"
             self.driver.save_screenshot(debug_screenshot)
             print(f"Saved debug screenshot to {debug_screenshot}")
-            
-            print("All extraction methods failed")
-            return False
-            
         except Exception as e:
-            print(f"Error extracting chat message: {e}")
-            # Take a screenshot for debugging
-            try:
-                debug_screenshot = os.path.splitext(filename)[0] + "_error.png"
-                self.driver.save_screenshot(debug_screenshot)
-                print(f"Saved error screenshot to {debug_screenshot}")
-            except:
-                pass
-            return False
-    
+            print(f"Could not save debug screenshot: {e}")
+
+        print("All extraction methods failed")
+        return False
+
     def extract_chat_message_to_memory(self):
         """
         Extract the first chat message and return it as text rather than saving to file.
-        
+
         Returns:
             str: Extracted text content or None if extraction failed
         """
         print("Attempting to extract chat message...")
-        
-        # Try multiple methods to find chat messages
+
+        text_content = self._extract_first_message()
+        if text_content:
+            print(f"Successfully extracted chat message of {len(text_content)} characters")
+            return text_content
+
+        # Save a debug screenshot without saving text
         try:
-            # Method 1: Look for ChatMessageContainer class directly (most reliable)
-            print("Method 1: Looking for ChatMessageContainer elements...")
-            message_containers = self.driver.find_elements(By.CSS_SELECTOR, ".ChatMessageContainer")
-            
-            if message_containers:
-                print(f"Found {len(message_containers)} message containers")
-                # Get the first container (oldest message)
-                text_content = message_containers[0].text
-                if text_content:
-                    print(f"Successfully extracted chat message of {len(text_content)} characters")
-                    return text_content
-            else:
-                print("No ChatMessageContainer elements found")
-                
-            # Method 2: Look for any elements with data-message-id attribute
-            print("Method 2: Looking for elements with data-message-id...")
-            message_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-message-id]")
-            
-            if message_elements:
-                print(f"Found {len(message_elements)} message elements with data-message-id")
-                # Get the first one
-                text_content = message_elements[0].text
-                if text_content:
-                    print(f"Successfully extracted chat message of {len(text_content)} characters")
-                    return text_content
-            else:
-                print("No elements with data-message-id found")
-                
-            # Method 3: Look for message content by class names often used in chat interfaces
-            print("Method 3: Looking for message content by class names...")
-            content_classes = [
-                ".prose", ".prose-markdown", ".break-anywhere", ".whitespace-pre-wrap", 
-                ".message-content", ".chat-message", ".user-message"
-            ]
-            
-            for class_selector in content_classes:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, class_selector)
-                if elements:
-                    print(f"Found {len(elements)} elements with selector {class_selector}")
-                    text_content = elements[0].text
-                    if text_content:
-                        print(f"Successfully extracted chat message of {len(text_content)} characters")
-                        return text_content
-            
-            # Method 4: Last resort - take any visible text from the main area
-            print("Method 4: Looking for any visible text...")
-            
-            # Look for main content area using a more general selector
-            main_areas = self.driver.find_elements(By.CSS_SELECTOR, "main")
-            if main_areas:
-                for main in main_areas:
-                    try:
-                        # Get all paragraph elements
-                        paragraphs = main.find_elements(By.TAG_NAME, "p")
-                        if paragraphs:
-                            # Collect text from all paragraphs
-                            all_text = "\n".join([p.text for p in paragraphs if p.text])
-                            if all_text:
-                                print(f"Successfully extracted {len(all_text)} characters from paragraphs")
-                                return all_text
-                    except Exception as e:
-                        print(f"Error extracting paragraphs: {e}")
-            
-            # Save a debug screenshot without saving text
             debug_screenshot = os.path.join(os.getcwd(), "debug_screenshots", f"extract_failed_{int(time.time())}.png")
             os.makedirs(os.path.dirname(debug_screenshot), exist_ok=True)
             self.driver.save_screenshot(debug_screenshot)
             print(f"Saved debug screenshot to {debug_screenshot}")
-            
-            print("All extraction methods failed")
-            return None
-            
         except Exception as e:
-            print(f"Error extracting chat message: {e}")
-            return None
-    
+            print(f"Could not save debug screenshot: {e}")
+
+        print("All extraction methods failed")
+        return None
+
     def _save_text_to_file(self, text_content, filename):
         """
         Helper method to save text content to a file.
@@ -434,30 +551,42 @@ class WebsiteAutomation:
             text_content: The text content to save
             filename: The file to save the text to
         """
-        # Create directory if it doesn't exist
+        # exist_ok folds the exists-check and creation into one racefree
+        # call, and the cache skips even that after the first write
         directory = os.path.dirname(filename)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
-        
-        # Write content to file
-        with open(filename, 'w', encoding='utf-8') as file:
-            file.write(text_content)
+        if directory and directory not in _MKDIR_CACHE:
+            os.makedirs(directory, exist_ok=True)
+            _MKDIR_CACHE.add(directory)
         
+        # Encode once and write binary: skips the TextIOWrapper layer and
+        # newline translation for what is a single large string
+        with open(filename, 'wb') as file:
+            file.write(text_content.encode('utf-8'))
+
         print(f"Successfully saved text content to {filename}")
     
-    def get_console_logs(self):
+    def get_console_logs(self, all_entries=False):
         """
         Get browser console logs.
-        
+
+        chromedriver's get_log drains its buffer, so each call returns only
+        entries newer than the last drain; those deltas are archived in
+        self._log_buffer for callers who want the whole session.
+
+        Args:
+            all_entries: Return the full archived history instead of only
+                the entries that arrived since the previous call
+
         Returns:
             list: Console log entries
         """
         try:
             logs = self.driver.get_log('browser')
-            return logs
         except Exception as e:
             print(f"Error getting console logs: {e}")
-            return []
+            logs = []
+        self._log_buffer.extend(logs)
+        return self._log_buffer if all_entries else logs
     
     def check_console_for_errors(self, keywords=None):
         """
@@ -470,18 +599,63 @@ class WebsiteAutomation:
             tuple: (has_errors, error_messages)
         """
         if keywords is None:
-            keywords = ['error', 'exception', 'fail', 'already', 'taken', 'exists']
-            
+            pattern = self._DEFAULT_ERROR_RE
+        else:
+            pattern = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
         logs = self.get_console_logs()
         error_messages = []
-        
+
         for log in logs:
-            log_level = log.get('level', '').lower()
-            log_message = log.get('message', '').lower()
-            
-            # Check for error level or keywords in message
-            if log_level == 'severe' or any(keyword.lower() in log_message for keyword in keywords):
+            # Check for error level or keywords in message; the pattern is
+            # case-insensitive so no per-entry lowercasing is needed
+            if log.get('level', '').lower() == 'severe' or pattern.search(log.get('message', '')):
                 error_messages.append(log)
                 
         has_errors = len(error_messages) > 0
         return has_errors, error_messages
+
+
+def run_in_parallel(urls, task_fn, max_workers=4, headless=True):
+    """
+    Run task_fn(bot, url) across many URLs with isolated browsers.
+
+    WebDriver sessions are not thread-safe, so each worker thread drives its
+    own WebsiteAutomation instance; independent sessions make the workload
+    embarrassingly parallel. Browsers released by quit() go back to the class
+    pool, so successive tasks on a thread reuse a warm Chrome.
+
+    Args:
+        urls: URLs to process
+        task_fn: Callable invoked as task_fn(bot, url) with a started browser
+        max_workers: Number of concurrent browser sessions
+        headless: Whether worker browsers run headless (default True)
+
+    Returns:
+        list: One task_fn result per URL, in input order
+    """
+    def worker(url):
+        bot = WebsiteAutomation(url, headless=headless)
+        try:
+            bot.start()
+            return task_fn(bot, url)
+        finally:
+            bot.quit()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(worker, urls))
+
+
+def shutdown_pool():
+    """Quit every parked browser; registered to run automatically at exit."""
+    with WebsiteAutomation._pool_lock:
+        parked = [d for drivers in WebsiteAutomation._driver_pool.values() for d in drivers]
+        WebsiteAutomation._driver_pool.clear()
+    for driver in parked:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(shutdown_pool)
@@ -2,6 +2,8 @@ import time
 import os
 import argparse
 import csv
+import itertools
+import logging
 from urllib.parse import urlparse
 import pyautogui
 from selenium.webdriver.common.by import By
@@ -33,16 +35,14 @@ def read_urls_from_csv(csv_path, start_index=0, limit=None):
     try:
         with open(csv_path, 'r') as csvfile:
             csv_reader = csv.reader(csvfile)
-            
-            # Skip URLs before the start_index
-            for i, row in enumerate(csv_reader):
-                if i < start_index:
-                    continue
-                    
+
+            # islice skips the leading rows in C and reads lazily, so only
+            # the requested window is ever pulled from the file
+            for row in itertools.islice(csv_reader, start_index, None):
                 if row and row[0].strip():  # Check if row exists and first cell is not empty
                     url = row[0].strip()
                     urls.append(url)
-                    
+
                     # Stop once we have enough URLs
                     if limit and len(urls) >= limit:
                         break
@@ -244,16 +244,19 @@ def process_url(url, bot, groq_processor, output_dir, wait_time, domain_log_file
         if current_url != url:
             print(f"Navigating to {url}")
             bot.navigate_to(url)
-            
-            # Wait to ensure the page loads
-            print(f"Waiting for page to load completely... ({wait_time} seconds)")
-            time.sleep(wait_time)
-            
+
+            # Proceed the moment the chat container exists instead of idling
+            # the full wait_time; a short sleep only covers the timeout case
+            print(f"Waiting for chat content to load (up to {wait_time} seconds)...")
+            if not bot.wait_for_element(By.CSS_SELECTOR, ".ChatMessageContainer", timeout=wait_time):
+                time.sleep(1)
+
             # Check again if we're on the right page
             if not bot.is_on_correct_page(url):
                 print("WARNING: May not be on the correct page. Attempting to navigate again...")
                 bot.navigate_to(url)
-                time.sleep(wait_time)
+                if not bot.wait_for_element(By.CSS_SELECTOR, ".ChatMessageContainer", timeout=wait_time):
+                    time.sleep(1)
         
         # Extract the project ID for filename
         parsed_url = urlparse(url)
@@ -350,9 +353,15 @@ def process_url(url, bot, groq_processor, output_dir, wait_time, domain_log_file
 
 def main():
     """Main execution function."""
+    # The automation modules log at INFO (domain banners, save confirmations);
+    # without a handler those messages are silently dropped
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Extract chat messages and generate URLs")
-    parser.add_argument('--url', help="Single URL of a Lovable.dev project (overrides CSV)")
+    parser.add_argument('--url', nargs='+',
+                        help="One or more Lovable.dev project URLs (overrides CSV); "
+                             "all share a single browser session and login")
     parser.add_argument('--csv', default="lovable-links.csv",
                         help="CSV file containing URLs (default: lovable-links.csv)")
     parser.add_argument('--start', type=int, default=0,
@@ -408,7 +417,7 @@ def main():
     
     # Determine which URLs to process
     if args.url:
-        urls = [args.url]
+        urls = args.url
     else:
         # Process URLs from CSV starting at the specified index
         limit = None if args.limit == 0 else args.limit
@@ -2,6 +2,7 @@ import os
 import time
 import csv
 import argparse
+import logging
 import sys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -298,6 +299,10 @@ def takeover_domain(url, bot, domains_list, output_file, wait_time=5):
 
 def main():
     """Main execution function."""
+    # The automation modules log at INFO; without a handler those messages
+    # are silently dropped
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="Domain Takeover Tool")
     parser.add_argument('--url', required=True, help="URL of the Lovable.dev project to take over")
     parser.add_argument('--csv', help="CSV file containing domain names to use")